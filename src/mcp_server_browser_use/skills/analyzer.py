@@ -9,7 +9,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from .models import AuthRecovery, FallbackConfig, MoneyRequest, NavigationStep, SessionRecording, Skill, SkillHints, SkillParameter, SkillRequest
-from .prompts import ANALYSIS_SYSTEM_PROMPT, get_analysis_prompt
+from .prompts import ANALYSIS_SYSTEM_PROMPT, MAX_PROMPT_POST_DATA_CHARS, MAX_PROMPT_RESPONSE_BODY_CHARS, get_analysis_prompt
 
 if TYPE_CHECKING:
     from browser_use.llm.base import BaseChatModel
@@ -49,7 +49,7 @@ class SkillAnalyzer:
             logger.warning("No API calls found in recording")
             return None
 
-        # Format API calls for analysis
+        # Format API calls for analysis (bodies capped to what the prompt includes)
         api_calls_data = []
         for req, resp in api_calls:
             call_data = {
@@ -58,8 +58,8 @@ class SkillAnalyzer:
                 "status": resp.status,
                 "content_type": resp.mime_type,
                 "has_body": resp.body is not None,
-                "post_data": req.post_data[:500] if req.post_data else None,
-                "response_body": resp.body[:2000] if resp.body else None,
+                "post_data": req.post_data[:MAX_PROMPT_POST_DATA_CHARS] if req.post_data else None,
+                "response_body": resp.body[:MAX_PROMPT_RESPONSE_BODY_CHARS] if resp.body else None,
             }
             api_calls_data.append(call_data)
 
@@ -70,7 +70,10 @@ class SkillAnalyzer:
         try:
             from browser_use.llm.messages import SystemMessage, UserMessage
 
-            response = await self.llm.ainvoke([SystemMessage(content=ANALYSIS_SYSTEM_PROMPT), UserMessage(content=prompt)])
+            # cache=True marks the fixed system prompt for Anthropic prompt caching. At ~450 tokens it is
+            # below Anthropic's 1024-token minimum cacheable prefix, so nothing is cached yet: the
+            # marker is ignored until the prompt grows past that size.
+            response = await self.llm.ainvoke([SystemMessage(content=ANALYSIS_SYSTEM_PROMPT, cache=True), UserMessage(content=prompt)])
 
             # Parse response - browser-use returns ChatInvokeCompletion with .completion
             result = self._parse_analysis_response(response.completion)
@@ -42,9 +42,12 @@ def strip_sensitive_headers(headers: dict[str, str]) -> dict[str, str]:
 # --- Recording Models (captured during learning) ---
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkRequest:
-    """A captured network request during recording."""
+    """A captured network request during recording.
+
+    Slotted: one instance is created per network event, so recordings can hold thousands.
+    """
 
     url: str
     method: str
@@ -55,9 +58,9 @@ class NetworkRequest:
     request_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkResponse:
-    """A captured network response during recording."""
+    """A captured network response during recording (slotted, like NetworkRequest)."""
 
     url: str
     status: int
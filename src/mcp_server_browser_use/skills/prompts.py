@@ -4,6 +4,8 @@ Learning Mode: Agent is instructed to discover and use APIs, not DOM scraping.
 Analysis Mode: LLM identifies the "money request" from recorded network traffic.
 """
 
+from collections.abc import Iterator
+
 # --- Learning Mode Prompt ---
 # This is APPENDED to the user's task when learn=True
 
@@ -91,53 +93,83 @@ If no suitable API was found, return:
 """
 
 
+# Static pieces of the analysis prompt, joined around the per-session values
+_ANALYSIS_PROMPT_HEAD = "Analyze this browser session to extract a reusable skill.\n\nORIGINAL TASK:\n"
+_ANALYSIS_PROMPT_RESULT = "\n\nAGENT RESULT:\n"
+_ANALYSIS_PROMPT_CALLS = "\n\nAPI CALLS RECORDED (XHR/Fetch only):\n"
+_ANALYSIS_PROMPT_TAIL = """
+
+Identify the "money request" - the API call that returned the data the user asked for.
+Consider which endpoint returned data most relevant to the task.
+
+Return your analysis as JSON.
+"""
+
+# Maximum request/response body sizes included per API call in the analysis prompt
+MAX_PROMPT_POST_DATA_CHARS = 500
+MAX_PROMPT_RESPONSE_BODY_CHARS = 1000
+
+# Per-call block of the API call listing, formatted from the call summary dict
+_API_CALL_TEMPLATE = """
+{i}. {method} {url}
+   Status: {status}
+   Content-Type: {content_type}
+   Has Response Body: {has_body}
+"""
+_API_CALL_POST_DATA_TEMPLATE = "   Request Body: {}...\n"
+_API_CALL_RESPONSE_BODY_TEMPLATE = "   Response Body (truncated): {}...\n"
+
+
 def get_analysis_prompt(task: str, result: str, api_calls: list[dict]) -> str:
     """Generate the analysis prompt with recorded data.
 
     Args:
         task: Original user task
         result: Agent's final result
-        api_calls: List of API call summaries from recorder
+        api_calls: List of API call summaries, with post_data and response_body
+            already truncated to MAX_PROMPT_POST_DATA_CHARS / MAX_PROMPT_RESPONSE_BODY_CHARS
 
     Returns:
         Formatted prompt for skill analysis
     """
-    # Format API calls for the prompt
-    api_calls_text = ""
+    return "".join(iter_analysis_prompt(task, result, api_calls))
+
+
+def iter_analysis_prompt(task: str, result: str, api_calls: list[dict]) -> Iterator[str]:
+    """Yield the analysis prompt in pieces without materializing the full string.
+
+    Takes the same arguments as get_analysis_prompt(), which joins these pieces.
+    Useful for clients that accept an iterable request body.
+    """
+    yield _ANALYSIS_PROMPT_HEAD
+    yield task
+    yield _ANALYSIS_PROMPT_RESULT
+    yield result
+    yield _ANALYSIS_PROMPT_CALLS
     for i, call in enumerate(api_calls, 1):
-        api_calls_text += f"""
-{i}. {call["method"]} {call["url"]}
-   Status: {call["status"]}
-   Content-Type: {call["content_type"]}
-   Has Response Body: {call["has_body"]}
-"""
+        yield _API_CALL_TEMPLATE.format_map({**call, "i": i})
         if call.get("post_data"):
-            api_calls_text += f"   Request Body: {call['post_data'][:500]}...\n"
+            yield _API_CALL_POST_DATA_TEMPLATE.format(call["post_data"])
         if call.get("response_body"):
-            api_calls_text += f"   Response Body (truncated): {call['response_body'][:1000]}...\n"
+            yield _API_CALL_RESPONSE_BODY_TEMPLATE.format(call["response_body"])
+    yield _ANALYSIS_PROMPT_TAIL
 
-    return f"""Analyze this browser session to extract a reusable skill.
 
-ORIGINAL TASK:
-{task}
+# --- Hint Injection Prompt ---
+# This is PREPENDED to the user's task when executing with a skill
 
-AGENT RESULT:
-{result}
 
-API CALLS RECORDED (XHR/Fetch only):
-{api_calls_text}
+_EXECUTION_HINTS_HEAD = 'SKILL HINTS (from previous successful execution of "'
+_EXECUTION_HINTS_BODY = '"):\n\n'
+_EXECUTION_HINTS_TAIL = """
 
-Identify the "money request" - the API call that returned the data the user asked for.
-Consider which endpoint returned data most relevant to the task.
+Use these hints to navigate efficiently. If the hints don't match
+what you see (API changed, page restructured), fall back to normal exploration.
 
-Return your analysis as JSON.
+YOUR TASK:
 """
 
 
-# --- Hint Injection Prompt ---
-# This is PREPENDED to the user's task when executing with a skill
-
-
 def get_execution_hints(skill_name: str, hints_text: str) -> str:
     """Generate execution hints from a skill.
 
@@ -148,12 +180,4 @@ def get_execution_hints(skill_name: str, hints_text: str) -> str:
     Returns:
         Formatted hints to prepend to task
     """
-    return f"""SKILL HINTS (from previous successful execution of "{skill_name}"):
-
-{hints_text}
-
-Use these hints to navigate efficiently. If the hints don't match
-what you see (API changed, page restructured), fall back to normal exploration.
-
-YOUR TASK:
-"""
+    return "".join((_EXECUTION_HINTS_HEAD, skill_name, _EXECUTION_HINTS_BODY, hints_text, _EXECUTION_HINTS_TAIL))
@@ -6,7 +6,7 @@ during a browser session so they can be analyzed to extract skills.
 Key design decisions (validated by GPT 5.2 Pro):
 - Uses UUID for request IDs (not id(request) which can collide after GC)
 - Works with browser-use's CDP-based architecture
-- Tracks pending async tasks with finalize() for proper cleanup
+- Captures bodies on a pool of worker tasks; finalize() waits for them and stops the pool
 - Redacts sensitive headers (cookies, auth tokens) for security
 - Captures response bodies for JSON API calls
 
@@ -15,8 +15,10 @@ with browser-use's CDP client for network event capture.
 """
 
 import asyncio
+import base64
 import logging
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -53,12 +55,42 @@ JSON_CONTENT_TYPES = frozenset(
     }
 )
 
+# CDP resource types (lowercased) that count as API calls
+API_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+
 # Maximum body size to capture (128KB)
 MAX_BODY_SIZE = 128 * 1024
 
+# Base64 characters needed to decode MAX_BODY_SIZE bytes (whole 4-char groups)
+_MAX_BODY_BASE64_LEN = ((MAX_BODY_SIZE + 2) // 3) * 4
+
 # Timeout for body capture (5 seconds)
 BODY_CAPTURE_TIMEOUT = 5.0
 
+# Maximum requests/responses kept per recording; oldest are evicted beyond this
+MAX_RECORDED_EVENTS = 10_000
+
+
+def _is_json_mime_type(mime_type: str) -> bool:
+    """Check if a mime type is JSON, ignoring parameters like "; charset=utf-8"."""
+    # CDP usually reports the bare lowercase type, so try an exact hit before any string work
+    if mime_type in JSON_CONTENT_TYPES:
+        return True
+    # All JSON_CONTENT_TYPES are application/* or text/* - reject image/*, font/*, etc. without lowercasing
+    if not mime_type or mime_type[0] not in "aAtT":
+        return False
+    return mime_type.partition(";")[0].strip().lower() in JSON_CONTENT_TYPES
+
+
+def _should_capture_body(resource_type: str, mime_type: str) -> bool:
+    """Check if a response is a JSON API call whose body is worth capturing.
+
+    Args:
+        resource_type: Lowercased CDP resource type
+        mime_type: Response mime type as reported by CDP
+    """
+    return resource_type in API_RESOURCE_TYPES and _is_json_mime_type(mime_type)
+
 
 class SkillRecorder:
     """Records browser session network events for skill extraction.
@@ -75,30 +107,41 @@ class SkillRecorder:
         recording = recorder.get_recording(result="Found 10 jobs")
     """
 
-    def __init__(self, task: str, redact_headers: bool = True, max_concurrent_captures: int = 5):
+    def __init__(
+        self,
+        task: str,
+        redact_headers: bool = True,
+        max_concurrent_captures: int = 5,
+        max_events: int = MAX_RECORDED_EVENTS,
+    ):
         """Initialize recorder.
 
         Args:
             task: The task being executed (for recording metadata)
             redact_headers: Whether to redact sensitive headers (default: True)
-            max_concurrent_captures: Max concurrent body capture tasks (default: 5)
+            max_concurrent_captures: Max getResponseBody calls in flight at once (default: 5)
+            max_events: Max requests (and responses) kept; the oldest are evicted first (default: 10000)
         """
         self.task = task
         self.start_time = datetime.now()
         self.redact_headers = redact_headers
 
-        # Storage for captured events
-        self._requests: dict[str, NetworkRequest] = {}  # keyed by CDP requestId
-        self._responses: list[NetworkResponse] = []
+        # Storage for captured events, bounded by max_events.
+        # OrderedDicts so the oldest entry can be evicted in O(1).
+        self._max_events = max_events
+        self._requests: OrderedDict[str, NetworkRequest] = OrderedDict()  # keyed by CDP requestId
         self._navigation_urls: list[str] = []
         self._failed_requests: list[dict] = []  # Track failed requests
+        self._api_request_ids: set[str] = set()  # CDP requestIds of XHR/Fetch requests
 
-        # Mapping from CDP requestId to our stored data (for response body capture)
-        self._cdp_to_response: dict[str, NetworkResponse] = {}
+        # Responses keyed by CDP requestId; dict order doubles as arrival order
+        self._responses: OrderedDict[str, NetworkResponse] = OrderedDict()
 
-        # Async task tracking for body captures
-        self._pending_tasks: set[asyncio.Task] = set()
-        self._capture_semaphore = asyncio.Semaphore(max_concurrent_captures)
+        # Body captures are queued and drained by max_concurrent_captures worker tasks,
+        # started on the first queued capture, each running one getResponseBody call at a time
+        self._body_queue: asyncio.Queue[tuple[str, NetworkResponse, str | None]] = asyncio.Queue()
+        self._body_workers: list[asyncio.Task] = []
+        self._max_concurrent_captures = max_concurrent_captures
 
         # Browser session reference
         self._browser_session: BrowserSession | None = None
@@ -107,8 +150,11 @@ class SkillRecorder:
     def _redact_headers(self, headers: dict[str, str]) -> dict[str, str]:
         """Redact sensitive headers for security.
 
+        Returns the headers dict itself when nothing needs redacting (the common
+        case), and only copies it when a sensitive header is present.
+
         Args:
-            headers: Original headers dict
+            headers: Original headers dict (as received from CDP)
 
         Returns:
             Headers with sensitive values replaced by "[REDACTED]"
@@ -116,12 +162,15 @@ class SkillRecorder:
         if not self.redact_headers:
             return headers
 
-        result = {}
-        for key, value in headers.items():
-            if key.lower() in SENSITIVE_HEADERS:
+        # Lowercase each key once; the set check then runs entirely in C
+        lowered_keys = [key.lower() for key in headers]
+        if SENSITIVE_HEADERS.isdisjoint(lowered_keys):
+            return headers
+
+        result = dict(headers)
+        for key, lowered in zip(headers, lowered_keys, strict=True):
+            if lowered in SENSITIVE_HEADERS:
                 result[key] = "[REDACTED]"
-            else:
-                result[key] = value
         return result
 
     async def attach(self, browser_session: "BrowserSession") -> None:
@@ -158,30 +207,33 @@ class SkillRecorder:
             request_id = event.get("requestId", "")
             request_data = event.get("request", {})  # type: ignore[arg-type]
 
-            # Extract headers (CDP Headers type is dict-like)
-            raw_headers: dict[str, str] = dict(request_data.get("headers", {}))  # type: ignore[arg-type]
-
-            # Determine resource type
+            # Determine resource type (stored lowercased so later scans need no .lower())
             resource_type = event.get("type", "Other").lower()
 
             # Capture request details
             network_request = NetworkRequest(
                 url=request_data.get("url", ""),
                 method=request_data.get("method", "GET"),
-                headers=self._redact_headers(raw_headers),
+                headers=self._redact_headers(request_data.get("headers", {})),  # type: ignore[arg-type]
                 post_data=request_data.get("postData"),
                 resource_type=resource_type,
                 timestamp=time.time(),
                 request_id=request_id,
             )
 
+            if len(self._requests) >= self._max_events and request_id not in self._requests:
+                self._evict(next(iter(self._requests)))
             self._requests[request_id] = network_request
+            if resource_type in API_RESOURCE_TYPES:
+                self._api_request_ids.add(request_id)
 
             # Track navigation (Document type)
             if resource_type == "document":
                 self._navigation_urls.append(request_data.get("url", ""))
 
-            logger.debug(f"Recorded CDP request: {network_request.method} {network_request.url[:80]}...")
+            # Per-event logging: skip building the message unless debug is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Recorded CDP request: %s %s...", network_request.method, network_request.url[:80])
 
         except Exception as e:
             logger.debug(f"Error recording CDP request: {e}")
@@ -189,16 +241,13 @@ class SkillRecorder:
     def _on_response_received(self, event: "ResponseReceivedEvent", session_id: str | None) -> None:
         """Handle CDP Network.responseReceived event.
 
-        This is a synchronous callback. Spawns async task for body capture.
+        This is a synchronous callback. Queues body capture for the worker task.
         """
         try:
             request_id = event.get("requestId", "")
             response_data = event.get("response", {})  # type: ignore[arg-type]
             resource_type = event.get("type", "Other").lower()
 
-            # Extract headers (CDP Headers type is dict-like)
-            raw_headers: dict[str, str] = dict(response_data.get("headers", {}))  # type: ignore[arg-type]
-
             # Get content type
             mime_type = response_data.get("mimeType", "")
 
@@ -206,27 +255,24 @@ class SkillRecorder:
             network_response = NetworkResponse(
                 url=response_data.get("url", ""),
                 status=response_data.get("status", 0),
-                headers=self._redact_headers(raw_headers),
+                headers=self._redact_headers(response_data.get("headers", {})),  # type: ignore[arg-type]
                 body=None,  # Body captured async if needed
                 mime_type=mime_type,
                 timestamp=time.time(),
                 request_id=request_id,
             )
 
-            self._responses.append(network_response)
-            self._cdp_to_response[request_id] = network_response
+            if len(self._responses) >= self._max_events and request_id not in self._responses:
+                self._evict(next(iter(self._responses)))
+            self._responses[request_id] = network_response
 
             # Schedule body capture for API calls (XHR/Fetch with JSON content)
-            if resource_type in ("xhr", "fetch"):
-                if any(ct in mime_type.lower() for ct in JSON_CONTENT_TYPES):
-                    task = asyncio.create_task(
-                        self._capture_body_cdp(request_id, network_response, session_id),
-                        name=f"capture_body_{request_id[:8]}",
-                    )
-                    self._pending_tasks.add(task)
-                    task.add_done_callback(lambda t: self._pending_tasks.discard(t))
+            if self._attached and _should_capture_body(resource_type, mime_type):
+                self._body_queue.put_nowait((request_id, network_response, session_id))
+                self._start_body_workers()
 
-            logger.debug(f"Recorded CDP response: {network_response.status} {network_response.url[:80]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Recorded CDP response: %s %s...", network_response.status, network_response.url[:80])
 
         except Exception as e:
             logger.debug(f"Error recording CDP response: {e}")
@@ -250,11 +296,45 @@ class SkillRecorder:
             }
             self._failed_requests.append(failure_info)
 
-            logger.debug(f"CDP request failed: {failure_info['url'][:80]} - {error_text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CDP request failed: %s - %s", failure_info["url"][:80], error_text)
 
         except Exception as e:
             logger.debug(f"Error recording CDP loading failure: {e}")
 
+    def _evict(self, request_id: str) -> None:
+        """Forget a request, its response and its API-call marker together."""
+        self._requests.pop(request_id, None)
+        self._responses.pop(request_id, None)
+        self._api_request_ids.discard(request_id)
+
+    def _start_body_workers(self) -> None:
+        """Start the body capture workers if they are not already running."""
+        if not self._body_workers:
+            self._body_workers = [
+                asyncio.create_task(self._drain_body_queue(), name=f"skill_recorder_body_capture_{i}") for i in range(self._max_concurrent_captures)
+            ]
+
+    async def _drain_body_queue(self) -> None:
+        """Worker loop: capture queued bodies one at a time until cancelled."""
+        queue = self._body_queue
+        while True:
+            item = await queue.get()
+            try:
+                await self._capture_body_cdp(*item)
+            finally:
+                queue.task_done()
+
+    async def _stop_body_workers(self) -> None:
+        """Cancel the body capture workers, wait for them to exit and drop any captures still queued."""
+        workers, self._body_workers = self._body_workers, []
+        for worker in workers:
+            worker.cancel()
+        while not self._body_queue.empty():
+            self._body_queue.get_nowait()
+            self._body_queue.task_done()
+        await asyncio.gather(*workers, return_exceptions=True)
+
     async def _capture_body_cdp(self, request_id: str, network_response: NetworkResponse, session_id: str | None) -> None:
         """Capture response body via CDP Network.getResponseBody.
 
@@ -263,41 +343,44 @@ class SkillRecorder:
             network_response: Our NetworkResponse to update with body
             session_id: CDP session ID (if any)
         """
-        async with self._capture_semaphore:
-            try:
-                if not self._browser_session:
-                    return
-
-                # Use CDP to get response body
-                result = await asyncio.wait_for(
-                    self._browser_session.cdp_client.send.Network.getResponseBody(
-                        params={"requestId": request_id},
-                        session_id=session_id,
-                    ),
-                    timeout=BODY_CAPTURE_TIMEOUT,
-                )
-
-                body = result.get("body", "")
-
-                # Handle base64 encoded bodies
-                if result.get("base64Encoded", False):
-                    import base64
+        try:
+            if not self._browser_session:
+                return
+
+            # Use CDP to get response body
+            result = await asyncio.wait_for(
+                self._browser_session.cdp_client.send.Network.getResponseBody(
+                    params={"requestId": request_id},
+                    session_id=session_id,
+                ),
+                timeout=BODY_CAPTURE_TIMEOUT,
+            )
 
-                    try:
-                        body = base64.b64decode(body).decode("utf-8", errors="replace")
-                    except Exception:
-                        body = "[Binary content - base64 decode failed]"
+            body = result.get("body", "")
+
+            # Handle base64 encoded bodies: decode only the prefix we keep, never the whole payload
+            if result.get("base64Encoded", False):
+                try:
+                    raw = base64.b64decode(body[:_MAX_BODY_BASE64_LEN])
+                    truncated = len(body) > _MAX_BODY_BASE64_LEN or len(raw) > MAX_BODY_SIZE
+                    body = raw[:MAX_BODY_SIZE].decode("utf-8", errors="replace")
+                except Exception:
+                    body = "[Binary content - base64 decode failed]"
+                    truncated = False
+            else:
+                truncated = len(body) > MAX_BODY_SIZE
+                if truncated:
+                    body = body[:MAX_BODY_SIZE]
 
-                # Truncate if too large
-                if len(body) > MAX_BODY_SIZE:
-                    body = body[:MAX_BODY_SIZE] + f"\n... [TRUNCATED at {MAX_BODY_SIZE} bytes]"
+            if truncated:
+                body += f"\n... [TRUNCATED at {MAX_BODY_SIZE} bytes]"
 
-                network_response.body = body
+            network_response.body = body
 
-            except TimeoutError:
-                logger.debug(f"CDP body capture timed out for request {request_id[:8]}")
-            except Exception as e:
-                logger.debug(f"Error capturing CDP body: {e}")
+        except TimeoutError:
+            logger.debug(f"CDP body capture timed out for request {request_id[:8]}")
+        except Exception as e:
+            logger.debug(f"Error capturing CDP body: {e}")
 
     async def detach(self) -> None:
         """Detach recorder (cleanup)."""
@@ -306,37 +389,34 @@ class SkillRecorder:
 
         # Note: CDP handlers are registered globally on the client
         # They will be cleaned up when the browser session closes
-        # We just mark ourselves as detached
+        # We just stop the body workers and mark ourselves as detached
 
+        await self._stop_body_workers()
         self._attached = False
         logger.debug("SkillRecorder detached")
 
     async def finalize(self, timeout: float = 30.0) -> None:
-        """Wait for all pending body capture tasks to complete.
+        """Wait for all queued body captures to complete, then stop the capture workers.
 
         Call this before get_recording() to ensure all bodies are captured.
+        Responses arriving afterwards (while still attached) start new workers.
 
         Args:
-            timeout: Maximum time to wait for pending tasks (default: 30s)
+            timeout: Maximum time to wait for pending captures (default: 30s)
         """
-        if not self._pending_tasks:
+        if not self._body_workers:
             return
 
-        logger.debug(f"Finalizing: waiting for {len(self._pending_tasks)} pending body captures...")
+        logger.debug(f"Finalizing: waiting for pending body captures ({self._body_queue.qsize()} queued)...")
 
         try:
-            await asyncio.wait_for(
-                asyncio.gather(*list(self._pending_tasks), return_exceptions=True),
-                timeout=timeout,
-            )
+            await asyncio.wait_for(self._body_queue.join(), timeout=timeout)
         except TimeoutError:
-            logger.warning(f"Finalize timed out after {timeout}s with {len(self._pending_tasks)} tasks remaining")
-            # Cancel remaining tasks
-            for task in self._pending_tasks:
-                if not task.done():
-                    task.cancel()
+            logger.warning(f"Finalize timed out after {timeout}s with {self._body_queue.qsize()} captures still queued")
+
+        # Cancels any in-flight captures (after a timeout) and drops the rest
+        await self._stop_body_workers()
 
-        self._pending_tasks.clear()
         logger.debug("Finalize complete")
 
     def get_recording(self, result: str) -> SessionRecording:
@@ -352,7 +432,7 @@ class SkillRecorder:
             task=self.task,
             result=result,
             requests=list(self._requests.values()),
-            responses=self._responses,
+            responses=list(self._responses.values()),
             navigation_urls=self._navigation_urls,
             start_time=self.start_time,
             end_time=datetime.now(),
@@ -366,13 +446,10 @@ class SkillRecorder:
         """
         api_calls = []
 
-        # Filter to XHR/Fetch requests
-        api_requests = {rid: req for rid, req in self._requests.items() if req.resource_type.lower() in ("xhr", "fetch")}
-
-        # Match with responses
-        for resp in self._responses:
-            if resp.request_id in api_requests:
-                req = api_requests[resp.request_id]
+        # Match XHR/Fetch requests with their responses
+        for resp in self._responses.values():
+            if resp.request_id in self._api_request_ids:
+                req = self._requests[resp.request_id]
                 api_calls.append(
                     {
                         "url": req.url,
@@ -393,4 +470,4 @@ class SkillRecorder:
     @property
     def api_call_count(self) -> int:
         """Number of XHR/Fetch API calls captured."""
-        return sum(1 for r in self._requests.values() if r.resource_type.lower() in ("xhr", "fetch"))
+        return len(self._api_request_ids)
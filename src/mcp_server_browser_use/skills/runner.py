@@ -17,34 +17,50 @@ import asyncio
 import ipaddress
 import json
 import logging
+import re
 import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
 from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs, quote, urlencode, urlparse, urlunparse
+from urllib.parse import ParseResult, parse_qs, quote, urlencode, urlparse, urlunparse
 
 import jmespath
 from jmespath.exceptions import JMESPathError
+from jmespath.visitor import TreeInterpreter
 
 from .models import AuthRecovery, Skill, SkillRequest
 
+try:
+    import orjson
+except ImportError:  # Optional: faster parsing of large JSON responses
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from browser_use.browser.session import BrowserSession, CDPSession
 
 logger = logging.getLogger(__name__)
 
-# Blocked hostnames (case-insensitive) - comprehensive localhost variants
-_BLOCKED_HOSTS = frozenset(
-    {
-        "localhost",
-        "127.0.0.1",
-        "::1",
-        "0.0.0.0",
-        "[::1]",
-        "[::]",
-        "[0:0:0:0:0:0:0:0]",
-        "[0:0:0:0:0:0:0:1]",
-    }
-)
+# Blocked hostnames (compared lowercased). IP spellings are not listed: every form of an
+# address (bracketed, zero-padded, decimal) is normalized by _normalize_ip and checked
+# against _BLOCKED_IPS instead.
+_BLOCKED_HOSTNAMES = frozenset({"localhost"})
+
+# Loopback/unspecified addresses, blocked explicitly on top of the _is_ip_blocked ranges
+_BLOCKED_IPS = frozenset(ipaddress.ip_address(ip) for ip in ("127.0.0.1", "::1", "0.0.0.0", "::"))
+
+# Resolved IPs per hostname: hostname -> (expires_at, ips). Small LRU with a short TTL so
+# repeated skill runs skip DNS; fetch-time re-validation bypasses it (DNS rebinding protection)
+_DNS_CACHE: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+_DNS_CACHE_TTL = 60.0
+_DNS_CACHE_MAX_SIZE = 1024
+
+# Dedicated threads for blocking getaddrinfo calls, so SSRF checks never queue behind other
+# work on the loop's default executor (threads are only started on demand)
+_DNS_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ssrf-dns")
 
 
 def _normalize_ip(host: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address | None:
@@ -72,12 +88,44 @@ def _normalize_ip(host: str) -> ipaddress.IPv4Address | ipaddress.IPv6Address |
         return None
 
 
+@lru_cache(maxsize=1024)
 def _is_ip_blocked(ip: ipaddress.IPv4Address | ipaddress.IPv6Address) -> bool:
-    """Check if IP is private, loopback, link-local, or reserved."""
+    """Check if IP is private, loopback, link-local, or reserved.
+
+    Cached: skills hit the same few addresses every run, and each property below
+    scans ipaddress's own network tables.
+    """
     return ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved or ip.is_multicast
 
 
-async def validate_url_safe(url: str) -> None:
+async def _resolve_hostname(hostname: str, use_cache: bool) -> tuple[str, ...]:
+    """Resolve hostname to its IP strings, using the TTL cache when allowed.
+
+    A fresh lookup always refreshes the cache, even when use_cache is False.
+    """
+    key = hostname.lower()
+    if use_cache:
+        cached = _DNS_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _DNS_CACHE.move_to_end(key)
+            return cached[1]
+
+    # DNS resolution - run in thread to avoid blocking event loop
+    try:
+        loop = asyncio.get_running_loop()
+        addr_info = await loop.run_in_executor(_DNS_EXECUTOR, socket.getaddrinfo, hostname, None)
+    except socket.gaierror as e:
+        raise ValueError(f"Cannot resolve hostname '{hostname}': {e}") from e
+
+    ips = tuple(sockaddr[0] for _family, _type, _proto, _canonname, sockaddr in addr_info)
+    _DNS_CACHE[key] = (time.monotonic() + _DNS_CACHE_TTL, ips)
+    _DNS_CACHE.move_to_end(key)
+    if len(_DNS_CACHE) > _DNS_CACHE_MAX_SIZE:
+        _DNS_CACHE.popitem(last=False)
+    return ips
+
+
+async def validate_url_safe(url: str | ParseResult, use_dns_cache: bool = True) -> None:
     """Validate URL is safe from SSRF attacks.
 
     Raises ValueError if URL is unsafe. Checks:
@@ -86,8 +134,13 @@ async def validate_url_safe(url: str) -> None:
     - Hostname exists and is not blocked
     - IP addresses are not private/reserved
     - DNS resolution returns only public IPs (DNS rebinding protection)
+
+    Args:
+        url: URL to validate, or its urlparse() result if the caller already has one
+        use_dns_cache: Reuse a recent DNS answer for the hostname. Pass False right before
+            the request is sent, so a rebound hostname is always re-resolved.
     """
-    parsed = urlparse(url)
+    parsed = urlparse(url) if isinstance(url, str) else url
 
     # Scheme check
     if parsed.scheme not in ("http", "https"):
@@ -106,53 +159,64 @@ async def validate_url_safe(url: str) -> None:
         hostname = hostname.split("%")[0]
 
     # Check blocked hostnames
-    if hostname.lower() in _BLOCKED_HOSTS:
+    if hostname.lower() in _BLOCKED_HOSTNAMES:
         raise ValueError(f"Hostname '{hostname}' is blocked")
 
     # Check if it's an IP address (various formats)
     ip = _normalize_ip(hostname)
     if ip is not None:
-        if _is_ip_blocked(ip):
+        if ip in _BLOCKED_IPS or _is_ip_blocked(ip):
             raise ValueError(f"IP '{ip}' is blocked (private/reserved)")
         return  # Valid public IP
 
-    # DNS resolution - run in thread to avoid blocking event loop
+    # Other numeric forms (127.1, 0x7f.0.0.1, 0177.0.0.1) resolve without DNS - no thread hop needed
     try:
-        loop = asyncio.get_running_loop()
-        addr_info = await loop.run_in_executor(None, socket.getaddrinfo, hostname, None)
-    except socket.gaierror as e:
-        raise ValueError(f"Cannot resolve hostname '{hostname}': {e}") from e
+        addr_info = socket.getaddrinfo(hostname, None, flags=socket.AI_NUMERICHOST)
+        resolved = tuple(sockaddr[0] for _family, _type, _proto, _canonname, sockaddr in addr_info)
+    except socket.gaierror:
+        resolved = await _resolve_hostname(hostname, use_dns_cache)
 
     # Check ALL resolved IPs (DNS rebinding protection)
-    for _family, _type, _proto, _canonname, sockaddr in addr_info:
-        resolved_ip = ipaddress.ip_address(sockaddr[0])
+    for resolved_str in resolved:
+        resolved_ip = ipaddress.ip_address(resolved_str)
         if _is_ip_blocked(resolved_ip):
             raise ValueError(f"Hostname '{hostname}' resolves to blocked IP '{resolved_ip}'")
 
 
-def validate_domain_allowed(url: str, allowed_domains: list[str]) -> None:
+@lru_cache(maxsize=128)
+def _compile_allowlist(allowed_domains: tuple[str, ...]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Normalize an allowlist once into exact hostnames and ".domain" suffixes."""
+    lowered = [allowed.lower() for allowed in allowed_domains]
+    return frozenset(lowered), tuple(f".{allowed}" for allowed in lowered)
+
+
+def validate_domain_allowed(url: str | ParseResult, allowed_domains: list[str]) -> None:
     """Validate URL domain is in allowlist.
 
     Empty allowlist means all domains allowed (for backwards compatibility).
     Supports subdomain matching: api.example.com matches allowlist entry example.com.
+    Accepts a URL string or an existing urlparse() result.
     """
     if not allowed_domains:
         return  # No restrictions
 
-    hostname = urlparse(url).hostname
+    hostname = (urlparse(url) if isinstance(url, str) else url).hostname
     if not hostname:
         raise ValueError("URL must have a hostname")
 
     hostname_lower = hostname.lower()
-    for allowed in allowed_domains:
-        allowed_lower = allowed.lower()
-        # Exact match or subdomain match
-        if hostname_lower == allowed_lower or hostname_lower.endswith(f".{allowed_lower}"):
-            return
+    exact, suffixes = _compile_allowlist(tuple(allowed_domains))
+    # Exact match or subdomain match
+    if hostname_lower in exact or hostname_lower.endswith(suffixes):
+        return
 
     raise ValueError(f"Domain '{hostname}' not in allowlist: {allowed_domains}")
 
 
+# {name} placeholders in URL templates
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
+
 def build_url(template: str, params: dict[str, Any]) -> str:
     """Build URL from template with proper encoding.
 
@@ -162,31 +226,65 @@ def build_url(template: str, params: dict[str, Any]) -> str:
     """
     parsed = urlparse(template)
 
+    # One regex pass per string; unknown placeholders are left as-is
+    def substitute_path(match: re.Match[str]) -> str:
+        key = match.group(1)
+        return quote(str(params[key]), safe="") if key in params else match.group(0)
+
+    def substitute_query(match: re.Match[str]) -> str:
+        key = match.group(1)
+        return str(params[key]) if key in params else match.group(0)
+
     # Substitute path parameters with URL encoding
-    path = parsed.path
-    for key, value in params.items():
-        placeholder = f"{{{key}}}"
-        if placeholder in path:
-            path = path.replace(placeholder, quote(str(value), safe=""))
+    path = _PLACEHOLDER_RE.sub(substitute_path, parsed.path)
 
-    # Substitute query parameters
+    # Substitute query parameters (urlencode below does the escaping)
     query_dict = parse_qs(parsed.query, keep_blank_values=True)
-    new_query_items: list[tuple[str, str]] = []
-
-    for key, values in query_dict.items():
-        for val in values:
-            new_val = val
-            for pk, pv in params.items():
-                placeholder = f"{{{pk}}}"
-                if placeholder in new_val:
-                    new_val = new_val.replace(placeholder, str(pv))
-            new_query_items.append((key, new_val))
+    new_query_items = [(key, _PLACEHOLDER_RE.sub(substitute_query, val)) for key, values in query_dict.items() for val in values]
 
     new_query = urlencode(new_query_items, safe="")
 
     return urlunparse((parsed.scheme, parsed.netloc, path, parsed.params, new_query, parsed.fragment))
 
 
+# Shared interpreter: ParsedResult.search() builds a new one (with a self-referencing method cache) per call
+_JMESPATH_INTERPRETER = TreeInterpreter()
+
+
+@lru_cache(maxsize=256)
+def _compile_jmespath(expression: str) -> "jmespath.parser.ParsedResult":
+    """Compile a JMESPath expression once; skills reuse the same extract_path on every run."""
+    return jmespath.compile(expression)
+
+
+@lru_cache(maxsize=1)
+def _html_parser_name() -> str:
+    """Pick the BeautifulSoup tree builder: C-based lxml if installed, else html.parser.
+
+    The builders repair malformed markup differently. lxml closes an open <p> at the next
+    <p>, as browsers do, so selectors such as "p p" can match under html.parser but not lxml.
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+def _loads_json(raw: str) -> Any:
+    """Parse JSON with orjson when available, falling back to the stdlib.
+
+    The fallback also covers input orjson rejects but json accepts (NaN, integers
+    wider than 64 bits), so results never depend on which parser is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def extract_data(data: Any, expression: str | None) -> Any:
     """Extract data using JMESPath expression.
 
@@ -199,7 +297,7 @@ def extract_data(data: Any, expression: str | None) -> Any:
         return data
 
     try:
-        return jmespath.search(expression, data)
+        return _JMESPATH_INTERPRETER.visit(_compile_jmespath(expression).parsed, data)
     except JMESPathError as e:
         raise ValueError(f"JMESPath extraction failed: {e}") from e
 
@@ -221,6 +319,59 @@ def is_private_url(url: str) -> bool:
         return False
 
 
+# Upper bound on waiting for a freshly navigated page before fetching (was a fixed sleep)
+NAVIGATION_SETTLE_TIMEOUT = 1.0
+
+# Delay between readiness probes while the navigated document has not committed yet
+NAVIGATION_POLL_INTERVAL = 0.05
+
+# Resolves with location.host once the document has been parsed; response cookies are in the jar by then
+_DOM_READY_JS = """
+new Promise(resolve => {
+    if (document.readyState !== 'loading') {
+        resolve(location.host);
+        return;
+    }
+    document.addEventListener('DOMContentLoaded', () => resolve(location.host), { once: true });
+})
+"""
+
+# In-page fetch wrapper run via Runtime.evaluate; $url and $options are JSON literals
+_FETCH_JS_TEMPLATE = Template("""
+(async () => {
+    let response;
+    try {
+        response = await fetch($url, $options);
+    } catch (error) {
+        return {
+            ok: false,
+            status: 0,
+            error: 'Fetch failed: ' + (error.message || String(error)),
+        };
+    }
+
+    // Capture status before reading the body (reading may fail)
+    const status = response.status;
+    const ok = response.ok;
+
+    try {
+        return {
+            ok: ok,
+            status: status,
+            body: await response.text(),
+        };
+    } catch (readError) {
+        return {
+            ok: ok,
+            status: status,
+            body: '',
+            error: 'Body read failed: ' + (readError.message || String(readError)),
+        };
+    }
+})()
+""")
+
+
 @dataclass
 class SkillRunResult:
     """Result of skill execution."""
@@ -281,33 +432,38 @@ class SkillRunner:
 
         # Build the fetch URL with proper encoding
         url = build_url(request.url, params)
+        parsed_url = urlparse(url)  # parsed once, shared by validation, navigation and fetch
+
+        # SSRF protection (DNS lookup) and CDP session setup are independent, so run them
+        # concurrently. Nothing is sent to the page until both have succeeded.
+        # Using session_id is critical: it bypasses browser-use watchdogs
+        validation, cdp_session = await asyncio.gather(
+            validate_url_safe(parsed_url),
+            self._get_cdp_session(browser_session),
+            return_exceptions=True,
+        )
 
         # SSRF protection - comprehensive async check
-        try:
-            await validate_url_safe(url)
-        except ValueError as e:
-            return SkillRunResult(success=False, error=f"SSRF blocked: {e}")
+        if isinstance(validation, ValueError):
+            return SkillRunResult(success=False, error=f"SSRF blocked: {validation}")
+        if isinstance(validation, BaseException):
+            raise validation
 
         # Domain allowlist enforcement (if configured)
         allowed_domains = getattr(request, "allowed_domains", [])
         try:
-            validate_domain_allowed(url, allowed_domains)
+            validate_domain_allowed(parsed_url, allowed_domains)
         except ValueError as e:
             return SkillRunResult(success=False, error=f"Domain not allowed: {e}")
 
-        parsed_url = urlparse(url)
+        if isinstance(cdp_session, BaseException):
+            logger.error(f"Failed to initialize CDP session: {cdp_session}")
+            return SkillRunResult(success=False, error=f"CDP session failed: {cdp_session}")
+
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
         logger.info(f"SkillRunner executing: {request.method} {url}")
 
-        # Get or create a CDP session with domains enabled
-        # This is critical: using session_id bypasses browser-use watchdogs
-        try:
-            cdp_session = await self._get_cdp_session(browser_session)
-        except Exception as e:
-            logger.error(f"Failed to initialize CDP session: {e}")
-            return SkillRunResult(success=False, error=f"CDP session failed: {e}")
-
         # Navigate to the domain first to establish cookie context
         try:
             await self._navigate_to_domain(browser_session, cdp_session, base_url)
@@ -316,7 +472,7 @@ class SkillRunner:
             return SkillRunResult(success=False, error=f"Navigation failed: {e}")
 
         # Execute the fetch
-        result = await self._execute_fetch(request, params, browser_session, cdp_session)
+        result = await self._execute_fetch(request, params, browser_session, cdp_session, url, parsed_url)
 
         # Check if auth recovery is needed
         if not result.success and auth_recovery and self._should_recover_auth(result, auth_recovery):
@@ -344,20 +500,18 @@ class SkillRunner:
         # Get the active target ID (current tab)
         cdp_session = await browser_session.get_or_create_cdp_session()
 
-        # Enable Page domain (required for navigation)
-        try:
-            await browser_session.cdp_client.send.Page.enable(session_id=cdp_session.session_id)
-            logger.debug(f"Enabled Page domain for session {cdp_session.session_id[-8:]}")
-        except Exception as e:
-            # May already be enabled by session manager
-            logger.debug(f"Page.enable: {e}")
-
-        # Enable Runtime domain (required for evaluate)
-        try:
-            await browser_session.cdp_client.send.Runtime.enable(session_id=cdp_session.session_id)
-            logger.debug(f"Enabled Runtime domain for session {cdp_session.session_id[-8:]}")
-        except Exception as e:
-            logger.debug(f"Runtime.enable: {e}")
+        # Enable Page (required for navigation) and Runtime (required for evaluate) in one round-trip.
+        # Failures are non-fatal: the session manager may already have enabled them.
+        results = await asyncio.gather(
+            browser_session.cdp_client.send.Page.enable(session_id=cdp_session.session_id),
+            browser_session.cdp_client.send.Runtime.enable(session_id=cdp_session.session_id),
+            return_exceptions=True,
+        )
+        for domain, enable_result in zip(("Page", "Runtime"), results, strict=True):
+            if isinstance(enable_result, BaseException):
+                logger.debug(f"{domain}.enable: {enable_result}")
+            else:
+                logger.debug(f"Enabled {domain} domain for session {cdp_session.session_id[-8:]}")
 
         return cdp_session
 
@@ -376,13 +530,14 @@ class SkillRunner:
             cdp_session: CDP session with Page domain enabled
             base_url: Base URL of the target domain
         """
+        target_parsed = urlparse(base_url)
+
         # Get current URL
         try:
             current_url = await self._get_current_url(browser_session, cdp_session)
             current_parsed = urlparse(current_url) if current_url else None
 
             # Only navigate if we're not already on the same domain
-            target_parsed = urlparse(base_url)
             if current_parsed and current_parsed.netloc == target_parsed.netloc:
                 logger.debug(f"Already on domain {target_parsed.netloc}, skipping navigation")
                 return
@@ -401,9 +556,34 @@ class SkillRunner:
         if nav_result.get("errorText"):
             raise RuntimeError(f"Navigation failed: {nav_result['errorText']}")
 
-        # Wait for page to stabilize using lifecycle event or simple delay
-        # A brief wait is needed for cookies to be established
-        await asyncio.sleep(1.0)
+        # Wait for the new document to be parsed so cookies are established, capped at
+        # NAVIGATION_SETTLE_TIMEOUT. Page.lifecycleEvent is not used: cdp_use keeps one handler
+        # per event and browser-use's session manager already owns that one.
+        # Page.navigate can return before the new document commits, and a probe evaluated in the
+        # outgoing page would report it as ready. So only a parsed document on the target host
+        # counts. A redirect to another host waits out the full timeout, like the old fixed sleep.
+        expected_host = target_parsed.netloc.lower()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + NAVIGATION_SETTLE_TIMEOUT
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                probe = await asyncio.wait_for(
+                    browser_session.cdp_client.send.Runtime.evaluate(
+                        params={"expression": _DOM_READY_JS, "awaitPromise": True, "returnByValue": True},
+                        session_id=cdp_session.session_id,
+                    ),
+                    timeout=remaining,
+                )
+                if probe.get("result", {}).get("value") == expected_host:
+                    return
+            except TimeoutError:
+                break
+            except Exception as e:
+                # Execution context swapped mid-navigation - probe again in the new document
+                logger.debug(f"Page readiness check failed: {e}")
+            await asyncio.sleep(min(NAVIGATION_POLL_INTERVAL, max(0.0, deadline - loop.time())))
+
+        logger.debug(f"Page on {expected_host} not ready after {NAVIGATION_SETTLE_TIMEOUT}s, continuing")
 
     async def _get_current_url(
         self,
@@ -434,6 +614,8 @@ class SkillRunner:
         params: dict[str, Any],
         browser_session: "BrowserSession",
         cdp_session: "CDPSession",
+        url: str,
+        parsed_url: ParseResult,
     ) -> SkillRunResult:
         """Execute fetch() via CDP Runtime.evaluate.
 
@@ -444,16 +626,16 @@ class SkillRunner:
             params: Parameters to substitute
             browser_session: Browser session
             cdp_session: CDP session with Runtime domain enabled
+            url: Request URL, as built and validated by run()
+            parsed_url: urlparse() result of url
 
         Returns:
             SkillRunResult with response data
         """
-        url = request.build_url(params)
-
         # CRITICAL: Re-validate URL immediately before fetch to prevent DNS rebinding (TOCTOU)
         # DNS could have been rebound from public to private IP since initial validation
         try:
-            await validate_url_safe(url)
+            await validate_url_safe(parsed_url, use_dns_cache=False)
         except ValueError as e:
             logger.error(f"SSRF protection: URL validation failed at fetch time: {e}")
             return SkillRunResult(success=False, error=f"SSRF blocked at fetch time: {e}")
@@ -461,7 +643,7 @@ class SkillRunner:
         options = request.to_fetch_options(params)
 
         # Build JavaScript fetch code
-        js_code = self._build_fetch_js(url, options, request.response_type)
+        js_code = self._build_fetch_js(url, options)
 
         logger.debug(f"Executing fetch: {request.method} {url}")
 
@@ -515,65 +697,20 @@ class SkillRunner:
             logger.error(f"Fetch execution failed: {e}")
             return SkillRunResult(success=False, error=str(e))
 
-    def _build_fetch_js(self, url: str, options: dict[str, Any], response_type: str) -> str:
+    def _build_fetch_js(self, url: str, options: dict[str, Any]) -> str:
         """Build JavaScript code for fetch execution.
 
+        The body is always returned as text; JSON is parsed once on the Python side
+        (see _parse_response) rather than parsed and re-stringified in the page.
+
         Args:
             url: Request URL
             options: Fetch options
-            response_type: Expected response type (json, html, text)
 
         Returns:
             JavaScript code string
         """
-        options_json = json.dumps(options)
-
-        # Build response handling based on type
-        if response_type == "json":
-            response_handler = "response.json()"
-        else:
-            response_handler = "response.text()"
-
-        return f"""
-(async () => {{
-    let response;
-    try {{
-        response = await fetch({json.dumps(url)}, {options_json});
-    }} catch (error) {{
-        return {{
-            ok: false,
-            status: 0,
-            error: 'Fetch failed: ' + (error.message || String(error)),
-        }};
-    }}
-
-    // Capture status before attempting body parse (may fail for non-JSON)
-    const status = response.status;
-    const ok = response.ok;
-
-    try {{
-        const body = await {response_handler};
-        return {{
-            ok: ok,
-            status: status,
-            body: typeof body === 'string' ? body : JSON.stringify(body),
-        }};
-    }} catch (parseError) {{
-        // Body parsing failed - try to get raw text for error context
-        let rawBody = '';
-        try {{
-            rawBody = await response.clone().text();
-        }} catch (e) {{}}
-
-        return {{
-            ok: ok,
-            status: status,
-            body: rawBody,
-            error: 'Body parse failed: ' + (parseError.message || String(parseError)),
-        }};
-    }}
-}})()
-"""
+        return _FETCH_JS_TEMPLATE.substitute(url=json.dumps(url), options=json.dumps(options))
 
     def _parse_response(self, raw_body: str, request: SkillRequest) -> Any:
         """Parse response according to skill configuration.
@@ -587,7 +724,7 @@ class SkillRunner:
         """
         if request.response_type == "json":
             try:
-                data = json.loads(raw_body) if isinstance(raw_body, str) else raw_body
+                data = _loads_json(raw_body) if isinstance(raw_body, str) else raw_body
 
                 # Extract using JMESPath if specified
                 if request.extract_path:
@@ -608,12 +745,12 @@ class SkillRunner:
             try:
                 from bs4 import BeautifulSoup
 
-                soup = BeautifulSoup(raw_body, "html.parser")
+                soup = BeautifulSoup(raw_body, _html_parser_name())
                 extracted: dict[str, list[str]] = {}
 
+                # soupsieve caches compiled selectors, so repeated runs don't re-parse them
                 for name, selector in request.html_selectors.items():
-                    elements = soup.select(selector)
-                    extracted[name] = [el.get_text(strip=True) for el in elements if el.get_text(strip=True)]
+                    extracted[name] = [text for el in soup.select(selector) if (text := el.get_text(strip=True))]
 
                 logger.debug(f"HTML extraction: {len(extracted)} fields extracted")
                 return extracted
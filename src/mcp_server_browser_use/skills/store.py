@@ -1,16 +1,46 @@
 """Skill storage and persistence using YAML files."""
 
+import json
 import logging
 import os
+import string
+import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from .models import Skill
 
+# Prefer the libyaml C bindings; fall back to the pure-Python safe loader/dumper
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Usage stats sidecar: record_usage updates this small JSON file instead of rewriting skill YAML
+STATS_FILENAME = "_stats.json"
+
+
+# ASCII characters kept as-is in skill filenames; every other ASCII character becomes "-"
+_FILENAME_SAFE_ASCII = frozenset(string.ascii_lowercase + string.digits + "-_")
+_FILENAME_TRANSLATION = str.maketrans({chr(i): "-" for i in range(128) if chr(i) not in _FILENAME_SAFE_ASCII})
+
+
+@lru_cache(maxsize=256)
+def _sanitize_skill_name(name: str) -> str:
+    """Map a skill name to a safe filename stem (lowercase alnum, '-' and '_')."""
+    lowered = name.lower()
+    if lowered.isascii():
+        return lowered.translate(_FILENAME_TRANSLATION)
+    # Non-ASCII names keep Unicode letters and digits (str.isalnum), as before
+    return "".join(c if c.isalnum() or c in "-_" else "-" for c in lowered)
+
 
 def get_default_skills_dir() -> Path:
     """Get the default skills directory."""
@@ -37,13 +67,92 @@ class SkillStore:
             self.directory = get_default_skills_dir()
 
         self.directory.mkdir(parents=True, exist_ok=True)
+        self._stats_path = self.directory / STATS_FILENAME
         logger.debug(f"Skills directory: {self.directory}")
 
     def _skill_path(self, name: str) -> Path:
         """Get path for a skill file."""
-        # Sanitize name for filename
-        safe_name = "".join(c if c.isalnum() or c in "-_" else "-" for c in name.lower())
-        return self.directory / f"{safe_name}.yaml"
+        return self.directory / f"{_sanitize_skill_name(name)}.yaml"
+
+    def _read_stats(self) -> dict[str, dict[str, Any]]:
+        """Read the usage stats sidecar, keyed by skill file stem.
+
+        Returns an empty dict if the file is missing or unreadable. Invalid
+        entries are skipped, so the affected skills fall back to their YAML stats.
+        """
+        try:
+            with self._stats_path.open("r", encoding="utf-8") as f:
+                stats = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable skill stats file {self._stats_path}: {e}")
+            return {}
+
+        if not isinstance(stats, dict):
+            logger.warning(f"Ignoring skill stats file {self._stats_path}: expected a JSON object")
+            return {}
+
+        valid: dict[str, dict[str, Any]] = {}
+        for stem, entry in stats.items():
+            if self._is_valid_stats_entry(entry):
+                valid[stem] = entry
+            else:
+                logger.warning(f"Ignoring invalid stats entry for {stem!r} in {self._stats_path}: {entry!r}")
+        return valid
+
+    @staticmethod
+    def _is_valid_stats_entry(entry: Any) -> bool:
+        """Check a sidecar entry: a dict with optional non-negative int counts and an ISO last_used."""
+        if not isinstance(entry, dict):
+            return False
+
+        for key in ("success_count", "failure_count"):
+            count = entry.get(key, 0)
+            if type(count) is not int or count < 0:
+                return False
+
+        last_used = entry.get("last_used")
+        if last_used is None:
+            return True
+        if not isinstance(last_used, str):
+            return False
+        try:
+            datetime.fromisoformat(last_used)
+        except ValueError:
+            return False
+        return True
+
+    def _write_stats(self, stats: dict[str, dict[str, Any]]) -> None:
+        """Atomically replace the usage stats sidecar.
+
+        Each write goes through its own temp file in the skills directory, so
+        concurrent writers (e.g. the server and the CLI) never share a temp path.
+        """
+        fd, tmp_name = tempfile.mkstemp(prefix=f"{STATS_FILENAME}.", suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stats, f, indent=2)
+            os.replace(tmp_name, self._stats_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _drop_stats(self, path: Path) -> None:
+        """Remove a skill's sidecar entry (its YAML is now authoritative, or gone)."""
+        stats = self._read_stats()
+        if stats.pop(path.stem, None) is not None:
+            self._write_stats(stats)
+
+    @staticmethod
+    def _apply_stats(skill: Skill, entry: dict[str, Any] | None) -> Skill:
+        """Overlay sidecar usage stats onto a skill loaded from YAML."""
+        if entry:
+            if entry.get("last_used"):
+                skill.last_used = datetime.fromisoformat(entry["last_used"])
+            skill.success_count = entry.get("success_count", skill.success_count)
+            skill.failure_count = entry.get("failure_count", skill.failure_count)
+        return skill
 
     def load(self, name: str) -> Skill | None:
         """Load a skill by name.
@@ -62,13 +171,13 @@ class SkillStore:
 
         try:
             with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
 
             if not data:
                 logger.warning(f"Empty skill file: {path}")
                 return None
 
-            skill = Skill.from_dict(data)
+            skill = self._apply_stats(Skill.from_dict(data), self._read_stats().get(path.stem))
             logger.debug(f"Loaded skill: {skill.name}")
             return skill
 
@@ -93,7 +202,10 @@ class SkillStore:
         data = skill.to_dict()
 
         with path.open("w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+        # The YAML now carries the skill's current stats
+        self._drop_stats(path)
 
         logger.info(f"Saved skill: {skill.name} to {path}")
         return path
@@ -113,6 +225,7 @@ class SkillStore:
             return False
 
         path.unlink()
+        self._drop_stats(path)
         logger.info(f"Deleted skill: {name}")
         return True
 
@@ -122,22 +235,27 @@ class SkillStore:
         Returns:
             List of all skills in the store
         """
+        stats = self._read_stats()
         skills = []
-
         for path in self.directory.glob("*.yaml"):
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-
-                if data:
-                    skill = Skill.from_dict(data)
-                    skills.append(skill)
-            except Exception as e:
-                logger.warning(f"Failed to load skill from {path}: {e}")
-                continue
+            skill = self._read_skill_file(path)
+            if skill is not None:
+                skills.append(self._apply_stats(skill, stats.get(path.stem)))
 
         return sorted(skills, key=lambda s: s.name)
 
+    def _read_skill_file(self, path: Path) -> Skill | None:
+        """Read one skill file for list_all, returning None if it is empty or invalid."""
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=SafeLoader)
+
+            if data:
+                return Skill.from_dict(data)
+        except Exception as e:
+            logger.warning(f"Failed to load skill from {path}: {e}")
+        return None
+
     def exists(self, name: str) -> bool:
         """Check if a skill exists.
 
@@ -152,21 +270,35 @@ class SkillStore:
     def record_usage(self, name: str, success: bool) -> None:
         """Record skill usage statistics.
 
+        Stats go to the JSON sidecar rather than the skill's YAML file, so a usage
+        update does not parse and re-emit the whole skill. load() and list_all()
+        overlay them; the next save() folds them back into the YAML.
+
         Args:
             name: Skill name
             success: Whether execution was successful
         """
-        skill = self.load(name)
-        if not skill:
+        path = self._skill_path(name)
+        if not path.exists():
             return
 
-        skill.last_used = datetime.now()
+        stats = self._read_stats()
+        entry = stats.get(path.stem)
+        if entry is None:
+            # First use since the skill was saved: start from the counts in its YAML
+            skill = self.load(name)
+            if not skill:
+                return
+            entry = {"success_count": skill.success_count, "failure_count": skill.failure_count}
+
+        entry["last_used"] = datetime.now().isoformat()
         if success:
-            skill.success_count += 1
+            entry["success_count"] = entry.get("success_count", 0) + 1
         else:
-            skill.failure_count += 1
+            entry["failure_count"] = entry.get("failure_count", 0) + 1
 
-        self.save(skill)
+        stats[path.stem] = entry
+        self._write_stats(stats)
 
     def to_yaml(self, skill: Skill) -> str:
         """Convert skill to YAML string.
@@ -177,7 +309,7 @@ class SkillStore:
         Returns:
             YAML string representation
         """
-        return yaml.dump(skill.to_dict(), default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml.dump(skill.to_dict(), Dumper=SafeDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     def from_yaml(self, yaml_content: str) -> Skill:
         """Parse skill from YAML string.
@@ -192,7 +324,7 @@ class SkillStore:
             ValueError: If YAML is invalid or missing required fields
         """
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml.load(yaml_content, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML: {e}") from e
 
@@ -1,5 +1,6 @@
 """Tests for the skills module."""
 
+import json
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock
 
@@ -351,6 +352,111 @@ class TestSkillRunner:
         # Page.navigate should NOT be called since we're already on the domain
         mock_browser_session.cdp_client.send.Page.navigate.assert_not_called()
 
+    async def test_navigation_waits_for_document_on_target_host(
+        self,
+        runner: SkillRunner,
+        mock_browser_session: MagicMock,
+    ):
+        # First probe runs in the outgoing page, second fails while the context swaps,
+        # third sees the new document
+        evaluate = AsyncMock(
+            side_effect=[
+                {"result": {"value": "old.example.org"}},
+                RuntimeError("Execution context was destroyed"),
+                {"result": {"value": "example.com"}},
+            ]
+        )
+        mock_browser_session.cdp_client.send.Runtime.evaluate = evaluate
+
+        await runner._navigate_to_domain(mock_browser_session, MockCDPSession(), "https://example.com")
+
+        assert evaluate.await_count == 3
+
+    async def test_navigation_falls_back_to_timeout_when_host_never_matches(
+        self,
+        runner: SkillRunner,
+        mock_browser_session: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        import time
+
+        from mcp_server_browser_use.skills import runner as runner_module
+
+        monkeypatch.setattr(runner_module, "NAVIGATION_SETTLE_TIMEOUT", 0.2)
+        evaluate = AsyncMock(return_value={"result": {"value": "old.example.org"}})
+        mock_browser_session.cdp_client.send.Runtime.evaluate = evaluate
+
+        start = time.monotonic()
+        await runner._navigate_to_domain(mock_browser_session, MockCDPSession(), "https://example.com")
+
+        # The outgoing page never counts as ready: the full settle timeout is waited out
+        assert time.monotonic() - start >= 0.2
+        assert evaluate.await_count > 1
+
+    async def test_run_fetches_encoded_validated_url(
+        self,
+        runner: SkillRunner,
+        mock_browser_session: MagicMock,
+    ):
+        # The fetch uses runner.build_url's output (the URL that passed SSRF validation):
+        # path params are percent-encoded, including "/", and the query is re-encoded
+        skill = Skill(
+            name="repo-issues",
+            description="List issues for a repo",
+            original_task="List issues",
+            request=SkillRequest(url="https://example.com/repos/{repo}/issues?q={query}", response_type="json"),
+        )
+        mock_browser_session.cdp_client.send.Runtime.evaluate = AsyncMock(
+            return_value={"result": {"value": {"ok": True, "status": 200, "body": "[]"}}}
+        )
+
+        result = await runner.run(skill, {"repo": "owner/repo", "query": "a b&c"}, mock_browser_session)
+
+        assert result.success is True
+        expression = mock_browser_session.cdp_client.send.Runtime.evaluate.call_args.kwargs["params"]["expression"]
+        assert 'fetch("https://example.com/repos/owner%2Frepo/issues?q=a+b%26c", ' in expression
+
+
+# --- HTML Extraction Tests ---
+
+
+class TestHTMLExtraction:
+    """Tests for html_selectors extraction in SkillRunner._parse_response."""
+
+    @pytest.fixture
+    def html_request(self) -> SkillRequest:
+        return SkillRequest(
+            url="https://example.com/search",
+            response_type="html",
+            html_selectors={"titles": ".result h3 a", "prices": ".result .price"},
+        )
+
+    def test_extracts_text_per_selector(self, html_request: SkillRequest):
+        html = """
+        <div class="result"><h3><a href="/1">First</a></h3><span class="price"> $10 </span></div>
+        <div class="result"><h3><a href="/2">Second</a></h3><span class="price"></span></div>
+        """
+        result = SkillRunner()._parse_response(html, html_request)
+
+        # Elements with no text are dropped
+        assert result == {"titles": ["First", "Second"], "prices": ["$10"]}
+
+    def test_uses_lxml_tree_builder(self):
+        pytest.importorskip("lxml")
+        from mcp_server_browser_use.skills.runner import _html_parser_name
+
+        assert _html_parser_name() == "lxml"
+
+    def test_lxml_closes_unclosed_paragraphs_like_a_browser(self):
+        # lxml follows browser parsing rules: a <p> start tag closes the open <p>, so
+        # paragraphs never nest (html.parser nested them and matched "p p")
+        pytest.importorskip("lxml")
+        request = SkillRequest(url="https://example.com", response_type="html", html_selectors={"nested": "p p", "all": "p"})
+
+        result = SkillRunner()._parse_response("<p>a<p>b</p></p>", request)
+
+        assert result == {"nested": [], "all": ["a", "b"]}
+
 
 # --- JMESPath Extraction Tests ---
 
@@ -393,3 +499,249 @@ class TestJMESPathExtraction:
         # JMESPath uses [0] syntax for array index access
         result = extract_data(data, "items[0]")
         assert result == "first"
+
+
+# --- SkillRecorder Tests ---
+
+
+def _request_event(request_id: str, resource_type: str = "XHR", headers: dict | None = None) -> dict:
+    return {
+        "requestId": request_id,
+        "type": resource_type,
+        "request": {"url": f"https://api.example.com/{request_id}", "method": "GET", "headers": headers or {}},
+    }
+
+
+def _response_event(request_id: str, resource_type: str = "XHR", mime_type: str = "application/json") -> dict:
+    return {
+        "requestId": request_id,
+        "type": resource_type,
+        "response": {"url": f"https://api.example.com/{request_id}", "status": 200, "mimeType": mime_type, "headers": {}},
+    }
+
+
+class TestSkillRecorder:
+    """Tests for SkillRecorder, driven through its CDP event handlers."""
+
+    @pytest.fixture
+    def recorder_session(self) -> MagicMock:
+        """Browser session whose getResponseBody echoes the request ID."""
+        session = MagicMock()
+
+        async def get_response_body(params, session_id=None):
+            return {"body": f"body-{params['requestId']}", "base64Encoded": False}
+
+        session.cdp_client.send.Network.getResponseBody = AsyncMock(side_effect=get_response_body)
+        return session
+
+    @staticmethod
+    def _record(recorder, request_id: str, resource_type: str = "XHR") -> None:
+        recorder._on_request_will_be_sent(_request_event(request_id, resource_type), None)
+        recorder._on_response_received(_response_event(request_id, resource_type), None)
+
+    @staticmethod
+    def _capture_tasks() -> list:
+        import asyncio
+
+        return [t for t in asyncio.all_tasks() if t.get_name().startswith("skill_recorder_body_capture") and not t.done()]
+
+    async def test_finalize_captures_every_body(self, recorder_session: MagicMock):
+        from mcp_server_browser_use.skills.recorder import SkillRecorder
+
+        recorder = SkillRecorder(task="test", max_concurrent_captures=3)
+        await recorder.attach(recorder_session)
+        for i in range(12):
+            self._record(recorder, f"r{i}")
+
+        await recorder.finalize()
+
+        recording = recorder.get_recording(result="done")
+        assert [r.body for r in recording.responses] == [f"body-r{i}" for i in range(12)]
+        assert recorder._body_queue.empty()
+        assert self._capture_tasks() == []
+
+    async def test_hung_capture_does_not_block_others_and_is_cancelled_on_timeout(self, recorder_session: MagicMock):
+        import asyncio
+
+        from mcp_server_browser_use.skills.recorder import SkillRecorder
+
+        cancelled = asyncio.Event()
+
+        async def get_response_body(params, session_id=None):
+            if params["requestId"] == "r0":
+                try:
+                    await asyncio.Event().wait()  # never answers
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return {"body": f"body-{params['requestId']}"}
+
+        recorder_session.cdp_client.send.Network.getResponseBody = AsyncMock(side_effect=get_response_body)
+        recorder = SkillRecorder(task="test", max_concurrent_captures=2)
+        await recorder.attach(recorder_session)
+        for i in range(10):
+            self._record(recorder, f"r{i}")
+
+        await recorder.finalize(timeout=0.5)
+
+        bodies = {r.request_id: r.body for r in recorder.get_recording(result="done").responses}
+        assert bodies.pop("r0") is None
+        assert bodies == {f"r{i}": f"body-r{i}" for i in range(1, 10)}
+        assert cancelled.is_set()
+        assert recorder._body_queue.empty()
+        assert self._capture_tasks() == []
+
+    async def test_detach_stops_workers_and_queueing(self, recorder_session: MagicMock):
+        import asyncio
+
+        from mcp_server_browser_use.skills.recorder import SkillRecorder
+
+        recorder_session.cdp_client.send.Network.getResponseBody = AsyncMock(side_effect=lambda **_: asyncio.Event().wait())
+        recorder = SkillRecorder(task="test")
+        await recorder.attach(recorder_session)
+        self._record(recorder, "r0")
+        assert recorder._body_workers
+
+        await recorder.detach()
+        await asyncio.sleep(0)
+        assert recorder._body_workers == []
+        assert self._capture_tasks() == []
+
+        # Handlers stay registered on the CDP client, but nothing is queued once detached
+        self._record(recorder, "r1")
+        assert recorder._body_queue.empty()
+        assert recorder._body_workers == []
+
+    async def test_eviction_keeps_requests_responses_and_api_ids_consistent(self, recorder_session: MagicMock):
+        from mcp_server_browser_use.skills.recorder import SkillRecorder
+
+        recorder = SkillRecorder(task="test", max_events=3)
+        await recorder.attach(recorder_session)
+        for i in range(5):
+            self._record(recorder, f"r{i}", resource_type="Document" if i == 3 else "XHR")
+        await recorder.finalize()
+
+        assert list(recorder._requests) == ["r2", "r3", "r4"]
+        assert list(recorder._responses) == ["r2", "r3", "r4"]
+        assert recorder._api_request_ids == {"r2", "r4"}
+        assert recorder.request_count == 3
+        assert recorder.api_call_count == 2
+        assert [call["url"] for call in recorder.get_api_calls_summary()] == ["https://api.example.com/r2", "https://api.example.com/r4"]
+
+    @pytest.mark.parametrize("extra_bytes", [1, 1000, 2 * 128 * 1024])
+    async def test_base64_body_over_limit_is_truncated(self, recorder_session: MagicMock, extra_bytes: int):
+        import base64
+
+        from mcp_server_browser_use.skills.recorder import MAX_BODY_SIZE, SkillRecorder
+
+        encoded = base64.b64encode(b"a" * (MAX_BODY_SIZE + extra_bytes)).decode()
+        recorder_session.cdp_client.send.Network.getResponseBody = AsyncMock(return_value={"body": encoded, "base64Encoded": True})
+        recorder = SkillRecorder(task="test")
+        await recorder.attach(recorder_session)
+        self._record(recorder, "r0")
+        await recorder.finalize()
+
+        body = recorder._responses["r0"].body
+        assert body == "a" * MAX_BODY_SIZE + f"\n... [TRUNCATED at {MAX_BODY_SIZE} bytes]"
+
+    async def test_base64_body_at_limit_is_not_truncated(self, recorder_session: MagicMock):
+        import base64
+
+        from mcp_server_browser_use.skills.recorder import MAX_BODY_SIZE, SkillRecorder
+
+        encoded = base64.b64encode(b"a" * MAX_BODY_SIZE).decode()
+        recorder_session.cdp_client.send.Network.getResponseBody = AsyncMock(return_value={"body": encoded, "base64Encoded": True})
+        recorder = SkillRecorder(task="test")
+        await recorder.attach(recorder_session)
+        self._record(recorder, "r0")
+        await recorder.finalize()
+
+        assert recorder._responses["r0"].body == "a" * MAX_BODY_SIZE
+
+    def test_headers_differing_only_in_case_are_all_redacted(self):
+        from mcp_server_browser_use.skills.recorder import SkillRecorder
+
+        recorder = SkillRecorder(task="test")
+        headers = {"Cookie": "a=1", "cookie": "b=2", "X-Api-Key": "secret", "Accept": "application/json"}
+        recorder._on_request_will_be_sent(_request_event("r0", headers=headers), None)
+
+        assert recorder._requests["r0"].headers == {
+            "Cookie": "[REDACTED]",
+            "cookie": "[REDACTED]",
+            "X-Api-Key": "[REDACTED]",
+            "Accept": "application/json",
+        }
+        # The event's own headers are left untouched
+        assert headers["Cookie"] == "a=1"
+
+
+# --- SkillStore Tests ---
+
+
+class TestSkillStore:
+    """Tests for SkillStore usage stats kept in the _stats.json sidecar."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from mcp_server_browser_use.skills.store import SkillStore
+
+        return SkillStore(directory=str(tmp_path))
+
+    def test_record_usage_overlays_stats_without_rewriting_yaml(self, store, skill_with_direct_execution):
+        path = store.save(skill_with_direct_execution)
+        yaml_before = path.read_text()
+
+        store.record_usage("test-skill", success=True)
+        store.record_usage("test-skill", success=True)
+        store.record_usage("test-skill", success=False)
+
+        assert path.read_text() == yaml_before
+        loaded = store.load("test-skill")
+        assert loaded is not None
+        assert (loaded.success_count, loaded.failure_count) == (2, 1)
+        assert loaded.last_used is not None
+        [listed] = store.list_all()
+        assert (listed.success_count, listed.failure_count) == (2, 1)
+        assert listed.last_used == loaded.last_used
+
+    def test_save_folds_stats_into_yaml(self, store, skill_with_direct_execution):
+        store.save(skill_with_direct_execution)
+        store.record_usage("test-skill", success=True)
+
+        store.save(store.load("test-skill"))
+
+        assert "test-skill" not in json.loads(store._stats_path.read_text())
+        reloaded = store.load("test-skill")
+        assert reloaded is not None
+        assert reloaded.success_count == 1
+
+    def test_delete_drops_stats_entry(self, store, skill_with_direct_execution, skill_without_direct_execution):
+        store.save(skill_with_direct_execution)
+        store.save(skill_without_direct_execution)
+        store.record_usage("test-skill", success=True)
+        store.record_usage("legacy-skill", success=False)
+
+        assert store.delete("test-skill")
+
+        assert set(json.loads(store._stats_path.read_text())) == {"legacy-skill"}
+
+    def test_malformed_stats_entries_are_ignored(self, store, skill_with_direct_execution, skill_without_direct_execution):
+        store.save(skill_with_direct_execution)
+        store.save(skill_without_direct_execution)
+        store._stats_path.write_text(
+            json.dumps(
+                {
+                    "test-skill": {"last_used": "yesterday", "success_count": 7},
+                    "legacy-skill": 5,
+                }
+            )
+        )
+
+        loaded = store.load("test-skill")
+        assert loaded is not None
+        assert (loaded.success_count, loaded.last_used) == (0, None)
+        assert [s.name for s in store.list_all()] == ["legacy-skill", "test-skill"]
+
+        # The next usage re-seeds the bad entry from the YAML
+        store.record_usage("test-skill", success=True)
+        assert store.load("test-skill").success_count == 1
@@ -38,9 +38,18 @@ from mcp_server_browser_use.skills.runner import (
         # IPv4 numeric formats (decimal)
         ("http://2130706433/", True),  # decimal for 127.0.0.1
         ("http://3232235521/", True),  # decimal for 192.168.0.1
+        # IPv4 shorthand/hex/octal forms (resolved numerically, no DNS)
+        ("http://127.1/", True),
+        ("http://0x7f.0.0.1/", True),
+        ("http://0177.0.0.1/", True),
         # IPv6 loopback
         ("http://[::1]/", True),
         ("http://[::1]:8080/", True),
+        ("http://[0:0:0:0:0:0:0:1]/", True),
+        ("http://[::0001]/", True),
+        ("http://[::]/", True),
+        ("http://LocalHost/", True),
+        ("http://0.0.0.0/", True),
         # IPv6 link-local
         ("http://[fe80::1]/", True),
         ("http://[fe80::1%25eth0]/", True),  # with zone ID
@@ -74,6 +83,28 @@ async def test_ssrf_validation(url: str, should_block: bool) -> None:
         await validate_url_safe(url)  # Should not raise
 
 
+async def test_ssrf_validation_rechecks_dns_when_cache_bypassed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a cached public answer cannot hide a rebind to a private IP at fetch time."""
+    import socket
+
+    from mcp_server_browser_use.skills import runner
+
+    answers = iter(["93.184.216.34", "127.0.0.1"])
+
+    def fake_getaddrinfo(host: str, port: object, *args: object, **kwargs: object) -> list:
+        if kwargs.get("flags"):
+            raise socket.gaierror(socket.EAI_NONAME, "not numeric")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (next(answers), 0))]
+
+    monkeypatch.setattr(runner, "_DNS_CACHE", type(runner._DNS_CACHE)())
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+
+    await validate_url_safe("https://rebind.example/")  # resolves public, cached
+    await validate_url_safe("https://rebind.example/")  # served from cache
+    with pytest.raises(ValueError, match="blocked IP"):
+        await validate_url_safe("https://rebind.example/", use_dns_cache=False)
+
+
 def test_normalize_ip_decimal() -> None:
     """Test decimal IP format is normalized correctly."""
     # 2130706433 = 127.0.0.1
@@ -244,6 +275,13 @@ def test_build_url_query_params() -> None:
     assert "page=1" in url
 
 
+def test_build_url_values_not_reexpanded() -> None:
+    """Test a parameter value that looks like a placeholder is not substituted again."""
+    url = build_url("https://api.example.com/search?q={term}&page={page}", {"term": "{page}", "page": "1"})
+    assert "q=%7Bpage%7D" in url
+    assert "page=1" in url
+
+
 def test_build_url_unicode() -> None:
     """Test unicode characters are encoded."""
     url = build_url("https://api.example.com/search/{query}", {"query": "日本語"})